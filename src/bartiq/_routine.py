@@ -328,17 +328,18 @@ class Routine(BaseModel):
         Raises:
             ValueError: If ancestor is not, in fact, an ancestor of self.
         """
-
-        # For root node return an empty string
-        if self.parent is None and ancestor is None and exclude_root_name:
-            return ""
-        if self.parent is ancestor:
-            return self.name
-        else:
-            try:
-                return f"{self.parent.relative_path_from(ancestor, exclude_root_name=exclude_root_name)}.{self.name}"  # type: ignore # noqa: E501
-            except (ValueError, AttributeError) as e:
-                raise ValueError("Ancestor not found.") from e
+        # Collect the names of the routines up to (but excluding) the ancestor, then join them starting from the top
+        names = []
+        routine = self
+        while routine.parent is not ancestor:
+            if routine.parent is None:
+                raise ValueError("Ancestor not found.")
+            names.append(routine.name)
+            routine = routine.parent
+
+        # For root node the name is replaced by an empty string
+        names.append("" if ancestor is None and exclude_root_name else routine.name)
+        return ".".join(reversed(names))
 
     def absolute_path(self, exclude_root_name: bool = False) -> str:
         """Returns a path from root.
@@ -406,10 +407,11 @@ class Port(BaseModel):
             exclude_root_name: If true, excludes name of root from the path. Default: False
         """
         assert self.parent is not None
-        if self.parent.absolute_path(exclude_root_name=exclude_root_name) == "":
+        parent_path = self.parent.absolute_path(exclude_root_name=exclude_root_name)
+        if parent_path == "":
             return f"#{self.name}"
         else:
-            return f"{self.parent.absolute_path(exclude_root_name=exclude_root_name)}.#{self.name}"
+            return f"{parent_path}.#{self.name}"
 
 
 class Connection(BaseModel):
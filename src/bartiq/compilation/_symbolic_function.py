@@ -456,8 +456,9 @@ def define_expression_functions(
         strict: If ``True``, throws an error if the function being defined doesn't occur in the expression.
 
     """
-    # Define defaults
-    functions_map = functions_map or {}
+    # Nothing to define, so there is no need to rebuild (and re-verify) the function
+    if not functions_map:
+        return function
 
     # If we're not being strict, go find the subset of expression functions that occur in the map and function
     if not strict:
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import ast
+from functools import lru_cache
+from keyword import iskeyword
 from typing import Any, TypeVar
 
 from .. import Routine
@@ -24,14 +26,12 @@ T = TypeVar("T", bound=Routine)
 
 def is_single_parameter(expression: Any) -> bool:
     """Returns True if the expression is just a single parameter, else False."""
+    # Fast path for the most common case of a plain, non-namespaced parameter name.
+    # Keywords (like lambda or None) need the full treatment below.
+    if isinstance(expression, str) and expression.isidentifier() and not iskeyword(expression):
+        return True
     try:
-        return _is_python_tree_a_single_param(
-            ast.parse(
-                expression.replace("#", "__hash__").replace(  # Handle hashes in port names
-                    "lambda", "__lambda__"
-                )  # Handle special case of lambda
-            )
-        )
+        return _parses_to_single_parameter(expression)
     except (TypeError, AttributeError):
         return False  # If it's not a string then certainly it's not a single parameter
     except SyntaxError as e:  # In principle this should not happen
@@ -40,6 +40,18 @@ def is_single_parameter(expression: Any) -> bool:
         ) from e
 
 
+# The same parameters and sizes are checked many times during compilation, hence the cache.
+@lru_cache(maxsize=4096)
+def _parses_to_single_parameter(expression: str) -> bool:
+    return _is_python_tree_a_single_param(
+        ast.parse(
+            expression.replace("#", "__hash__").replace(  # Handle hashes in port names
+                "lambda", "__lambda__"
+            )  # Handle special case of lambda
+        )
+    )
+
+
 def _is_python_tree_a_single_param(tree):
     return (
         # is parsed expression a module?
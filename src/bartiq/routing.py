@@ -14,14 +14,15 @@
 
 from typing import Optional
 
-from bartiq._routine import Connection, Port
+from bartiq._routine import Port
 
 
 def join_paths(*paths: str) -> str:
-    """Helper function for joining paths in a routine."""
-    if paths[0] == "":
-        paths = paths[1:]
-    return ".".join(paths)
+    """Helper function for joining paths in a routine.
+
+    Empty paths (e.g. the path of the root routine with its name excluded) are skipped.
+    """
+    return ".".join(path for path in paths if path)
 
 
 def get_port_source(port: Port) -> Port:
@@ -29,8 +30,7 @@ def get_port_source(port: Port) -> Port:
     It ignores the intermediate ports, like parent's ports, which only facilitate
     connections through layers of hierarchy, but do not provide meaningful inputs.
     """
-    route = get_route(port, forward=False)
-    return route[-1]
+    return _get_terminal_port(port, forward=False)
 
 
 def get_port_target(port: Port) -> Port:
@@ -38,42 +38,55 @@ def get_port_target(port: Port) -> Port:
     It ignores the intermediate ports, like parent's ports, which only facilitate
     connections through layers of hierarchy, but do not provide meaningful inputs.
     """
-    route = get_route(port, forward=True)
-    return route[-1]
+    return _get_terminal_port(port, forward=True)
 
 
 def get_route(port: Port, forward: bool = True) -> list[Port]:
     """Returns a list of all the ports that will be encountered when following particular port in either direction."""
     route = [port]
-    pred = _is_source if forward else _is_target
+    get_next_port = _get_next_downstream_port if forward else _get_next_upstream_port
 
-    while (successor := _get_next_port(port, pred)) is not None:
+    while (successor := get_next_port(port)) is not None:
         port = successor
         route.append(port)
     return route
 
 
-def _is_source(port: Port, connection: Connection) -> bool:
-    return connection.source is port
+def _get_terminal_port(port: Port, forward: bool) -> Port:
+    """Follows the port in given direction and returns the last port reached, without recording the route."""
+    get_next_port = _get_next_downstream_port if forward else _get_next_upstream_port
+
+    while (successor := get_next_port(port)) is not None:
+        port = successor
+    return port
 
 
-def _is_target(port: Port, connection: Connection) -> bool:
-    return connection.target is port
+# The two functions below are deliberately kept separate instead of sharing a
+# generic implementation parametrized with a predicate, as they lie on a hot path.
+def _get_next_downstream_port(port: Port) -> Optional[Port]:
+    routine = port.parent
+    ancestry_depth = 0
 
+    # Terminate whenever we reach either root or grand-grand parent of port.
+    while routine is not None and ancestry_depth < 2:
+        for connection in routine.connections:
+            if connection.source is port:
+                return connection.target
+        routine = routine.parent
+        ancestry_depth += 1
 
-def _other_end(port: Port, connection: Connection) -> Port:
-    return connection.source if connection.target is port else connection.target
+    return None
 
 
-def _get_next_port(port: Port, predicate) -> Optional[Port]:
+def _get_next_upstream_port(port: Port) -> Optional[Port]:
     routine = port.parent
     ancestry_depth = 0
 
     # Terminate whenever we reach either root or grand-grand parent of port.
     while routine is not None and ancestry_depth < 2:
         for connection in routine.connections:
-            if predicate(port, connection):
-                return _other_end(port, connection)
+            if connection.target is port:
+                return connection.source
         routine = routine.parent
         ancestry_depth += 1
 
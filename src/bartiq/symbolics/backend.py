@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Callable, Iterable, Optional, Protocol, TypeVar, Union
+from typing import AbstractSet, Callable, Iterable, Optional, Protocol, TypeVar, Union
 
 from ..compilation.types import Number
 
@@ -25,14 +25,14 @@ class SymbolicBackend(Protocol[T_expr]):
     def as_expression(self, value: Union[str, int, float]) -> T_expr:
         """Convert given value into an expression native to this backend."""
 
-    def free_symbols_in(self, expr: T_expr) -> Iterable[str]:
-        """Return an iterable over free symbols in given expression."""
+    def free_symbols_in(self, expr: T_expr) -> AbstractSet[str]:
+        """Return a set of free symbols in given expression."""
 
     def functions_in(self, expr: T_expr) -> Iterable[str]:
         """Return an iterable over functions in expr."""
 
-    def reserved_functions(self) -> Iterable[str]:
-        """Return an iterable over reserved functions."""
+    def reserved_functions(self) -> AbstractSet[str]:
+        """Return a set of reserved functions."""
 
     def value_of(self, expr: T_expr) -> Optional[Number]:
         """Return value of given expression."""
@@ -14,6 +14,8 @@
 
 from abc import ABC, abstractmethod
 from functools import wraps
+from types import MethodType
+from weakref import WeakSet
 
 from pyparsing import (
     Combine,
@@ -33,6 +35,9 @@ from pyparsing import (
 
 WILDCARD_CHARACTER = "~"
 
+# Functions returned by the debuggable decorator
+_DEBUGGABLE_METHODS = WeakSet()
+
 
 def make_parser(interpreter):
     """Construct a parser for our grammar."""
@@ -60,7 +65,9 @@ def make_parser(interpreter):
     )
 
     # Define numbers
-    number = pyparsing_common.number.set_name("number").set_parse_action(interpreter.create_number)
+    # pyparsing_common elements are shared module-level objects, so the parse action is set on a copy. Otherwise
+    # building a parser for one interpreter would rebind number parsing in every previously built parser.
+    number = pyparsing_common.number.copy().set_name("number").set_parse_action(interpreter.create_number)
 
     # Define functions
     function = Forward().set_name("function")
@@ -112,6 +119,26 @@ class Interpreter(ABC):
         """
         self.debug = debug
 
+    @property
+    def debug(self):
+        """Whether debug information is printed for the interpreter."""
+        return self._debug
+
+    @debug.setter
+    def debug(self, debug):
+        self._debug = debug
+
+        # When not debugging, the interpreting methods decorated directly with debuggable are bound on the instance
+        # without their wrappers. Parsers capture these methods when built, so they follow the mode set at that time.
+        for method_name in Interpreter.__abstractmethods__:
+            method = getattr(type(self), method_name)
+            if method not in _DEBUGGABLE_METHODS:
+                continue
+            if debug:
+                self.__dict__.pop(method_name, None)
+            else:
+                setattr(self, method_name, MethodType(method.__wrapped__, self))
+
     @abstractmethod
     def create_parameter(self, tokens):
         """Abstract method for interpreting parameter."""
@@ -150,4 +177,5 @@ def debuggable(method):
 
         return output
 
+    _DEBUGGABLE_METHODS.add(debuggable_method)
     return debuggable_method
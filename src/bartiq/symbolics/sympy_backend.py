@@ -18,10 +18,9 @@
 
 from __future__ import annotations
 
-from functools import singledispatch
-from typing import Callable, Iterable, Optional, Union
+from typing import AbstractSet, Callable, Iterable, Optional, Union
 
-from sympy import Expr, Function, N, Order, symbols, sympify
+from sympy import Expr, Function, N, Order, Product, Sum, Symbol, sympify
 from sympy.core.function import AppliedUndef
 
 from ..compilation.types import Number
@@ -33,48 +32,43 @@ NUM_DIGITS_PRECISION = 15
 # Order included here to allow for user-defined big O's
 SYMPY_USER_FUNCTION_TYPES = (AppliedUndef, Order)
 
-BUILT_IN_FUNCTIONS = list(SPECIAL_FUNCS) + list(TRY_IF_POSSIBLE_FUNCS)
+BUILT_IN_FUNCTIONS = frozenset(SPECIAL_FUNCS).union(TRY_IF_POSSIBLE_FUNCS)
 
 
 T_expr = Expr
 
 
-@singledispatch
-def _as_expression(value: Union[str | int | float]) -> T_expr:
-    return sympify(value)
-
-
-@_as_expression.register
-def _parse(value: str) -> T_expr:
-    return parse_to_sympy(value)
-
-
 def as_expression(value: Union[str | int | float]) -> T_expr:
     """Convert numerical or textual value into an expression."""
-    return _as_expression(value)
+    # Only strings need parsing, everything else goes straight through sympify.
+    return parse_to_sympy(value) if isinstance(value, str) else sympify(value)
 
 
-def free_symbols_in(expr: T_expr) -> Iterable[str]:
-    """Return an iterable over free symbol names in given expression."""
-    return map(str, expr.free_symbols)
+def free_symbols_in(expr: T_expr) -> AbstractSet[str]:
+    """Return a set of free symbol names in given expression."""
+    return frozenset(map(str, expr.free_symbols))
 
 
 def functions_in(expr: T_expr) -> Iterable[str]:
     """Returns the (non-built-in) functions referenced in the expression."""
+    reserved = reserved_functions()
     return [
-        func_name
-        for atom in expr.atoms(*SYMPY_USER_FUNCTION_TYPES)
-        if (func_name := str(type(atom))) not in reserved_functions()
+        func_name for atom in expr.atoms(*SYMPY_USER_FUNCTION_TYPES) if (func_name := str(type(atom))) not in reserved
     ]
 
 
-def reserved_functions() -> Iterable[str]:
-    """Return an iterable over all built-in functions."""
+def reserved_functions() -> AbstractSet[str]:
+    """Return a set of all built-in functions."""
     return BUILT_IN_FUNCTIONS
 
 
 def value_of(expr: T_expr) -> Optional[Number]:
     """Compute a numerical value of an expression, return None if it not possible."""
+    # Integers are by far the most common values and need no numerical evaluation or rounding.
+    # Note that expr may also be a plain Python number, e.g. returned by a user-defined function.
+    if isinstance(expr, int) or getattr(expr, "is_Integer", False):
+        return int(expr)
+
     # If numeric value possible, evaluate, otherwise return None
     try:
         value = N(expr).round(n=NUM_DIGITS_PRECISION)
@@ -94,9 +88,15 @@ def value_of(expr: T_expr) -> Optional[Number]:
 
 def substitute(expr: T_expr, symbol: str, replacement: Union[T_expr, Number]) -> T_expr:
     """Substitute occurrences of given symbol with an expression or numerical value."""
-    return (
-        as_expression(serialize(expr.subs(symbols(symbol), replacement))) if symbol in free_symbols_in(expr) else expr
-    )
+    if symbol not in free_symbols_in(expr):
+        return expr
+    # Replacing a free symbol only needs exact structural matching, which is what xreplace does.
+    # Sums and products go through subs, which leaves their bound variables alone even if they share the name.
+    if expr.has(Sum, Product):
+        substituted = expr.subs(Symbol(symbol), replacement)
+    else:
+        substituted = expr.xreplace({Symbol(symbol): sympify(replacement)})
+    return as_expression(serialize(substituted))
 
 
 def rename_function(expr: T_expr, old_name: str, new_name: str) -> T_expr:
@@ -13,9 +13,11 @@
 # limitations under the License.
 
 import operator
+import sys
 from functools import lru_cache
 
 from sympy import (
+    Basic,
     Function,
     Heaviside,
     LambertW,
@@ -68,7 +70,8 @@ from sympy.core.numbers import S as sympy_constants
 from .grammar import WILDCARD_CHARACTER, Interpreter, debuggable, make_parser
 
 
-@lru_cache
+# The default cache size of 128 is easily exceeded by the distinct expressions of a single routine tree
+@lru_cache(maxsize=4096)
 def parse_to_sympy(string, debug=False):
     """Parses a string to a sympy expression.
 
@@ -79,9 +82,13 @@ def parse_to_sympy(string, debug=False):
     Returns:
         sympy.Basic: Some sympy expression.
     """
-    interpreter = SympyInterpreter(debug=debug)
-    parser = make_parser(interpreter)
-    return parser.parse_string(string)[0]
+    return _make_sympy_parser(debug).parse_string(string)[0]
+
+
+@lru_cache
+def _make_sympy_parser(debug):
+    # Building the grammar is expensive and the resulting parser is stateless, so it is built once per debug mode.
+    return make_parser(SympyInterpreter(debug=debug))
 
 
 BINARY_OPS = {
@@ -229,10 +236,10 @@ class SympyInterpreter(Interpreter):
     @debuggable
     def create_parameter(self, tokens):
         """Return a sympy Symbol."""
-        param = tokens[0]
-        if param in SPECIAL_PARAMS:
-            return SPECIAL_PARAMS[param]
-        return Symbol(param)
+        # Parameter names repeat across many expressions, so they are interned to share a single string object
+        param = sys.intern(tokens[0])
+        special_param = SPECIAL_PARAMS.get(param)
+        return Symbol(param) if special_param is None else special_param
 
     @debuggable
     def create_function(self, tokens):
@@ -272,23 +279,28 @@ class SympyInterpreter(Interpreter):
     @debuggable
     def create_expression(self, tokens):
         """Return a sympy expression."""
-        lhs = tokens.pop(0)
-        while tokens:
-            op, *rhs = tokens.pop(0)
-            rhs = self.create_expression(rhs)
-            lhs = BINARY_OPS[op](lhs, rhs)
+        lhs, *groups = tokens
+        for op, *rhs in groups:
+            lhs = BINARY_OPS[op](lhs, self.create_expression(rhs))
         return lhs
 
     @debuggable
     def create_unary_atom(self, tokens):
         """Return a non-unary atom."""
+        # Most atoms have no sign prefix at all, in which case there is nothing to multiply by
+        if len(tokens) == 1:
+            return tokens[0]
         prefactor = 1
         while (token := tokens.pop(0)) in ["+", "-"]:
-            prefactor *= int(f"{token}1")
+            if token == "-":
+                prefactor = -prefactor
         assert len(tokens) == 0, f"Expected a single token remaining, found {tokens}."
         return prefactor * token
 
 
 def _contains_wildcard_arg(args):
     """Returns ``True`` if any argument contains the wildcard character."""
-    return any(WILDCARD_CHARACTER in str(arg) for arg in args)
+    # Wildcards can only appear in symbol names, so only the symbols in each argument are inspected.
+    return any(
+        WILDCARD_CHARACTER in symbol.name for arg in args if isinstance(arg, Basic) for symbol in arg.atoms(Symbol)
+    )
@@ -31,6 +31,18 @@ class VariableError(Exception):
     """Error class for errors associated with variables."""
 
 
+# Building blocks of the patterns used for parsing variables from strings.
+# The patterns are compiled once, as they are used every time a variable is parsed.
+_SYMB = r"([\w\.#]+)"
+_DESC = r"\((.+)\)"
+_WS = r"\s*"
+_VAL = r"(\w+)"
+_EXPR = r"(.+)"
+
+_INDEPENDENT_VARIABLE_PATTERN = re.compile(f"{_WS}{_SYMB}{_WS}(?:={_WS}{_VAL}{_WS})?(?:{_DESC}{_WS})?")
+_SYMBOL_EXPRESSION_PATTERN = re.compile(f"{_WS}{_SYMB}{_WS}={_WS}{_EXPR}{_WS}")
+
+
 @dataclass(frozen=True)
 class IndependentVariable:
     """A independent variable variable with no determined expression value."""
@@ -78,38 +90,16 @@ class IndependentVariable:
         Returns:
             A new independent variable.
         """
-        symb = r"([\w\.#]+)"
-        desc = r"\((.+)\)"
-        ws = r"\s*"
-        val = r"(\w+)"
-
-        # Case 1: symbol, value, description
-        if match := re.fullmatch(f"{ws}{symb}{ws}={ws}{val}{ws}{desc}{ws}", string):
-            symbol, value_str, description = match.groups()
-            value = parse_value(value_str)
-
-        # Case 2: symbol, value
-        elif match := re.fullmatch(f"{ws}{symb}{ws}={ws}{val}{ws}", string):
-            symbol, value_str = match.groups()
-            value = parse_value(value_str)
-            description = None
-
-        # Case 3: symbol, description
-        elif match := re.fullmatch(f"{ws}{symb}{ws}{desc}{ws}", string):
-            symbol, description = match.groups()
-            value = None
-
-        # Case 4: symbol
-        elif match := re.fullmatch(f"{ws}{symb}{ws}", string):
-            (symbol,) = match.groups()
-            value, description = None, None
-
-        else:
+        # A single pattern covers all four cases, with the value and description being optional
+        if (match := _INDEPENDENT_VARIABLE_PATTERN.fullmatch(string)) is None:
             raise BartiqCompilationError(
                 f"Failed to parse input string {string} for independent variable; "
                 "must be of format 'symbol', 'symbol (description)', 'symbol = value', or 'symbol = value (description)"
             )
 
+        symbol, value_str, description = match.groups()
+        value = None if value_str is None else parse_value(value_str)
+
         return cls(symbol, value=value, description=description)
 
     def __str__(self) -> str:
@@ -197,11 +187,12 @@ class DependentVariable(Generic[T_expr]):
     def _validate_expression_variables(self) -> None:
         """Ensures that the tracked expression variables match those of the backend."""
         user_expression_variables = set(self.expression_variables)
-        backend_expression_variables = set(self.backend.free_symbols_in(self.expression))
+        backend_expression_variables = self.backend.free_symbols_in(self.expression)
         if backend_expression_variables != user_expression_variables:
+            # Converted to a set only for the message, to print as {...} regardless of the set type returned
             raise BartiqCompilationError(
                 "User-supplied expression variables are not consistent with backend expression variables; "
-                f"expected {user_expression_variables}, but backend found {backend_expression_variables}."
+                f"expected {user_expression_variables}, but backend found {set(backend_expression_variables)}."
             )
 
     def _add_unknown_expression_functions(self) -> None:
@@ -322,7 +313,7 @@ class DependentVariable(Generic[T_expr]):
         if function_name in (reserved := self.backend.reserved_functions()):
             raise BartiqCompilationError(
                 f"Attempted to redefine built-in function {function_name} as {function_callable}; "
-                f"known built-in functions are {reserved}"
+                f"known built-in functions are {sorted(reserved)}"
             )
 
         new_expression_functions = self.expression_functions.copy()
@@ -349,12 +340,8 @@ class DependentVariable(Generic[T_expr]):
         Returns:
             A new dependent variable.
         """
-        symb = r"([\w\.#]+)"
-        expr = r"(.+)"
-        ws = r"\s*"
-
         # Case 1: symbol, expression
-        if match := re.fullmatch(f"{ws}{symb}{ws}={ws}{expr}{ws}", string):
+        if match := _SYMBOL_EXPRESSION_PATTERN.fullmatch(string):
             symbol, expression = match.groups()
 
         else:
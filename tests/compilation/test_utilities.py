@@ -37,6 +37,7 @@ from bartiq.compilation._utilities import (
         ("3.141", False),
         ("N+1", False),
         ("ceil(log_2(N))", False),
+        ("None", False),
         (None, False),
     ],
 )
@@ -11,11 +11,14 @@ Tests for our parsing grammar.
 """
 
 import re
+from functools import wraps
 
 import pytest
 from pyparsing import ParseException
+from sympy import Integer
 
 from bartiq.symbolics.grammar import Interpreter, debuggable, make_parser
+from bartiq.symbolics.sympy_interpreter import SympyInterpreter
 
 
 @pytest.mark.parametrize(
@@ -69,3 +72,51 @@ class DummyInterpreter(Interpreter):
     @debuggable
     def create_unary_atom(self, tokens):
         """Dummy method."""
+
+
+def test_building_a_parser_does_not_rebind_previously_built_parsers():
+    parser = make_parser(SympyInterpreter())
+    make_parser(DummyInterpreter())
+
+    assert isinstance(parser.parse_string("42")[0], Integer)
+
+
+def test_debuggable_wrappers_are_bypassed_when_not_debugging():
+    interpreter = DummyInterpreter(debug=False)
+
+    assert interpreter.create_number.__func__ is DummyInterpreter.create_number.__wrapped__
+    assert DummyInterpreter(debug=True).create_number.__func__ is DummyInterpreter.create_number
+
+
+def test_other_decorators_on_debuggable_methods_are_not_bypassed():
+    calls = []
+
+    def counted(method):
+        @wraps(method)
+        def counted_method(self, tokens):
+            calls.append(tokens)
+            return method(self, tokens)
+
+        return counted_method
+
+    class CountingInterpreter(SympyInterpreter):
+        @counted
+        @debuggable
+        def create_number(self, tokens):
+            return super().create_number(tokens)
+
+    make_parser(CountingInterpreter()).parse_string("1+2")
+
+    assert len(calls) == 2
+
+
+def test_debug_mode_can_be_toggled_after_construction(capsys):
+    interpreter = SympyInterpreter(debug=False)
+
+    interpreter.debug = True
+    make_parser(interpreter).parse_string("1")
+    assert "create_number" in capsys.readouterr().out
+
+    interpreter.debug = False
+    make_parser(interpreter).parse_string("1")
+    assert capsys.readouterr().out == ""
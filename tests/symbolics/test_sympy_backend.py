@@ -63,3 +63,25 @@ def test_attempt_to_define_builtin_function_fails():
 
     with pytest.raises(BartiqCompilationError):
         sympy_backend.define_function(expr, "cos", _f)
+
+
+def test_substitute_leaves_bound_variables_of_sums_intact():
+    expr = sympy_backend.as_expression("i + sum_over(i ^ 2, i, 1, N)")
+
+    assert sympy_backend.substitute(expr, "i", 3) == sympy_backend.as_expression("3 + sum_over(i ^ 2, i, 1, N)")
+
+
+def test_value_of_keeps_large_integers_exact():
+    expr = sympy_backend.as_expression("2 ^ 70")
+
+    assert sympy_backend.value_of(expr) == 2**70
+
+
+@pytest.mark.parametrize("value, expected", [(7, 7), (2.5, 2.5), (3.0, 3)])
+def test_value_of_accepts_plain_python_numbers(value, expected):
+    assert sympy_backend.value_of(value) == expected
+
+
+@pytest.mark.parametrize("expression, expected", [("sgn(5)", 1), ("sum()", 0), ("prod()", 1)])
+def test_value_of_expressions_parsed_to_python_ints(expression, expected):
+    assert sympy_backend.value_of(sympy_backend.as_expression(expression)) == expected